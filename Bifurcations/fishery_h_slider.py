@@ -1,8 +1,7 @@
-import numpy as np
-import math
-from matplotlib import pyplot as plt
 import ipywidgets as widgets
 from IPython.display import display
+from fishery_model import fixed_points
+from fishery_plots import phase_portrait_figure
 
 # Slider
 fishing = widgets.IntSlider(min=1., max=100.)
@@ -15,40 +14,9 @@ K = 800 # carrying capacity
 h = fishing.value
 A = 16
 
-# Plot fishery phase portrait (with saturation term)
-
-def fishery_model(n):
-    return r*n*(1-(n/K))-h*n/(A+n)
-
-pops = np.linspace(0., (5*K)/4, num = 3*K)
-
-# zeros calculated in wolfram alpha
-zeros = [0]
-fold = (A+K)**2 - 4*h*K/r
-# cut out zeros that aren't real
-if fold > 0:
-    zeros.append(0.5 * (K - A - math.sqrt(fold)))
-    zeros.append(0.5 * (K - A + math.sqrt(fold)))
-elif fold == 0:
-    zeros.append(K - A)
-    
-print(zeros)
+print(fixed_points(r, K, h, A))
 
 # Plot phase portrait
-fig = plt.figure()
-ax = plt.axes(xlim=(0,1.25*K), ylim=(-0.25*r*K,0.3*r*K))
-plt.plot(pops, fishery_model(pops))
-
-# Mark fixed points
-for fixed_point in zeros:
-    if fixed_point >=0:
-        plt.plot(fixed_point,0,'go')
-            
-
-# Turn on the grid
-plt.plot([0,5*K/4], [0,0], 'r-')
-ax.grid()
-plt.xlabel("Stock")
-plt.ylabel("Growth")
-
+import matplotlib.pyplot as plt
+fig = phase_portrait_figure(r, K, h, A)
 plt.show()
\ No newline at end of file
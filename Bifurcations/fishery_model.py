@@ -0,0 +1,21 @@
+import math
+import numpy as np
+
+#Growth of a fishery with logistic growth and saturating harvest h*n/(A+n)
+def fishery_model(n, r, K, h, A):
+    return r*n*(1-(n/K))-h*n/(A+n)
+
+#Stock levels to plot the growth curve over
+def stock_levels(K):
+    return np.linspace(0., (5*K)/4, num = 3*K)
+
+#Fixed points of the fishery model (zeros calculated in wolfram alpha), dropping the ones that aren't real
+def fixed_points(r, K, h, A):
+    zeros = [0]
+    fold = (A+K)**2 - 4*h*K/r
+    if fold > 0:
+        zeros.append(0.5 * (K - A - math.sqrt(fold)))
+        zeros.append(0.5 * (K - A + math.sqrt(fold)))
+    elif fold == 0:
+        zeros.append(K - A)
+    return zeros
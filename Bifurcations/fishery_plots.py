@@ -0,0 +1,20 @@
+from fishery_model import fishery_model, stock_levels, fixed_points
+
+#Plot fishery phase portrait (with saturation term), marking the non-negative fixed points
+def phase_portrait_figure(r, K, h, A):
+    import matplotlib.pyplot as plt
+    fig = plt.figure()
+    ax = plt.axes(xlim=(0,1.25*K), ylim=(-0.25*r*K,0.3*r*K))
+    pops = stock_levels(K)
+    ax.plot(pops, fishery_model(pops, r, K, h, A))
+
+    for fixed_point in fixed_points(r, K, h, A):
+        if fixed_point >=0:
+            ax.plot(fixed_point,0,'go')
+
+    # Turn on the grid
+    ax.plot([0,5*K/4], [0,0], 'r-')
+    ax.grid()
+    ax.set_xlabel("Stock")
+    ax.set_ylabel("Growth")
+    return fig
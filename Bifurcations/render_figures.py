@@ -0,0 +1,15 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.plotting import render_batch
+from fishery_plots import phase_portrait_figure
+
+#Draw the phase portraits the sliders step through, headless and in parallel
+if __name__ == '__main__':
+    r = 0.5
+    K = 800
+    os.makedirs('images', exist_ok=True)
+    jobs = [(phase_portrait_figure, (r, K, h, 16), 'images/fishery_h%d.png' % h) for h in [10, 25, 50, 75, 100]]
+    jobs += [(phase_portrait_figure, (r, K, 25, A), 'images/fishery_A%d.png' % A) for A in [1, 16, 30, 60]]
+    for filename in render_batch(jobs):
+        print('Saved', filename)
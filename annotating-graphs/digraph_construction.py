@@ -1,26 +1,35 @@
 #Import required packages
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.cache import PipelineCache
 import pandas as pd 
 import networkx as nx
-import matplotlib.pyplot as plt
+import numpy as np
+from ppi_network import interaction_graph, cluster_edge_betweenness
 
 #Read in cleaned data
 data = pd.read_csv('cleaned_data.csv')
 data.head()
 
 #Establish graph using edges from DataFrame
-edges = []
-for i in range(len(data)):
-    edge = (data.id_A[i], data.id_B[i], data.weight[i])
-    edges.append(edge)
-
-graph = nx.Graph()
-graph.add_weighted_edges_from(edges)
+#The network figures are drawn separately by render_figures.py
+graph = interaction_graph(data)
 
 #Create adjacency matrix
 A = nx.adjacency_matrix(graph)
 
-#Compute betweenness centralities
-betweenness_centralities = nx.betweenness_centrality(graph, 50)
+#Compute betweenness centralities, reusing an earlier run on the same cleaned_data.csv
+#Scores are stored in graph node order, which follows the edge list
+def betweenness():
+    bc = nx.betweenness_centrality(graph, 50, seed=0)
+    return {'bc': [bc[node] for node in graph]}
+
+result = PipelineCache().cached('betweenness', betweenness, inputs=['cleaned_data.csv'],
+                                params={'k': 50, 'seed': 0, 'networkx': nx.__version__},
+                                code=[os.path.abspath(__file__),
+                                      os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ppi_network.py')])
+betweenness_centralities = dict(zip(graph, result['bc'].tolist()))
 
 #Compute in and out degrees
 degrees = {node:val for (node, val) in graph.degree()}
@@ -46,14 +55,6 @@ merge.sort_values('degrees', ascending=False).drop_duplicates()
 
 
 
-def cluster_edge_betweenness(iterations, G):
-    for i in range(iterations):
-        print('Iteration ', i+1 , ' of ', iterations)
-        eb = nx.edge_betweenness_centrality(G, 10)
-        max_eb = max(eb, key=eb.get)
-        G.remove_edge(max_eb[0], max_eb[1])
-    return G
-
 new_graph = cluster_edge_betweenness(10, graph)
 
 #List of Alzheimer's related genes
@@ -0,0 +1,192 @@
+import hashlib
+import numpy as np
+
+#Layouts already computed, keyed by graph hash and layout parameters
+layout_cache = {}
+
+#Hash a graph by its node and edge lists so unchanged graphs reuse their layout
+def graph_hash(G):
+    h = hashlib.sha1()
+    for node in sorted(str(node) for node in G.nodes()):
+        h.update(node.encode() + b'\n')
+    h.update(b'--\n')
+    for edge in sorted('\t'.join(sorted((str(u), str(v)))) for u, v in G.edges()):
+        h.update(edge.encode() + b'\n')
+    return h.hexdigest()
+
+#Add per-pair forces onto the per-node displacement array
+def scatter_add(disp, index, force):
+    n = len(disp)
+    disp[:, 0] += np.bincount(index, weights=force[:, 0], minlength=n)
+    disp[:, 1] += np.bincount(index, weights=force[:, 1], minlength=n)
+
+#Finest grid level aims for about this many nodes per cell
+LEAF_SIZE = 4
+MAX_DEPTH = 12
+
+#Neighboring cell offsets, each pair of adjacent cells counted once
+NEAR_OFFSETS = [(0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+
+#Cell of every node in a 2^depth x 2^depth grid over the square holding the middle 98% of pos
+#A few loosely connected nodes drift far from the rest; sizing the grid by them would pack the
+#whole graph into a handful of cells, so they are clipped into the edge cells instead
+def grid_cells(pos, depth):
+    lo, hi = np.percentile(pos, [1, 99], axis=0)
+    size = max((hi - lo).max(), 1e-9)
+    side = 2 ** depth
+    cells = np.floor((pos - lo) / size * side).astype(np.int64)
+    return np.clip(cells, 0, side - 1)
+
+#Node pairs in the same or adjacent finest cells, one offset at a time to keep memory bounded
+def near_pairs(cells, depth):
+    side = 2 ** depth
+    cell_id = cells[:, 0]*side + cells[:, 1]
+    order = np.argsort(cell_id, kind='stable')
+    counts = np.bincount(cell_id, minlength=side*side)
+    starts = np.cumsum(counts) - counts
+    for dx, dy in NEAR_OFFSETS:
+        x = cells[:, 0] + dx
+        y = cells[:, 1] + dy
+        first = np.flatnonzero((x >= 0) & (x < side) & (y >= 0) & (y < side))
+        other = x[first]*side + y[first]
+        n_other = counts[other]
+        within = np.arange(n_other.sum()) - np.repeat(np.cumsum(n_other) - n_other, n_other)
+        second = order[np.repeat(starts[other], n_other) + within]
+        first = np.repeat(first, n_other)
+        if (dx, dy) == (0, 0):
+            keep = first < second
+            first, second = first[keep], second[keep]
+        yield first, second
+
+#Repulsion k^2 / d on every node, Barnes-Hut style on a grid hierarchy
+#Nodes in adjacent cells of the finest grid repel exactly. At every coarser level, each cell is pushed
+#by the cells that are children of its parent's neighbors but not adjacent to it (at most 27), treated
+#as point masses at their centroids. That push is expanded to first order around the cell's own
+#centroid, so every node gets its share from one force and one Jacobian per level. Every other node
+#is counted exactly once and the work per level is bounded by the number of cells, so an iteration
+#is O(n log n) however the layout clusters.
+def repulsion(pos, k):
+    n = len(pos)
+    depth = int(min(max(np.ceil(np.log(max(n / LEAF_SIZE, 1)) / np.log(4)), 2), MAX_DEPTH))
+    cells = grid_cells(pos, depth)
+    disp = np.zeros((n, 2))
+    min_dist_sq = (0.01*k) ** 2
+
+    for first, second in near_pairs(cells, depth):
+        if len(first) == 0:
+            continue
+        delta = pos[first] - pos[second]
+        dist_sq = np.maximum((delta ** 2).sum(axis=1), min_dist_sq)
+        force = delta * (k*k / dist_sq)[:, None]
+        scatter_add(disp, first, force)
+        scatter_add(disp, second, -force)
+
+    #Children of a parent's 3x3 neighborhood form a 6x6 block of cells
+    block_x, block_y = np.meshgrid(np.arange(6), np.arange(6), indexing='ij')
+    for level in range(2, depth + 1):
+        side = 2 ** level
+        n_cells = side*side
+        level_cells = cells >> (depth - level)
+        cell_id = level_cells[:, 0]*side + level_cells[:, 1]
+        mass = np.bincount(cell_id, minlength=n_cells)
+        centroids = np.stack([np.bincount(cell_id, weights=pos[:, 0], minlength=n_cells),
+                              np.bincount(cell_id, weights=pos[:, 1], minlength=n_cells)], axis=1)
+        centroids /= np.maximum(mass, 1)[:, None]
+
+        #Interaction list of every occupied cell
+        occupied = np.flatnonzero(mass)
+        x, y = occupied // side, occupied % side
+        sx = ((x >> 1)*2 - 2)[:, None] + block_x.ravel()
+        sy = ((y >> 1)*2 - 2)[:, None] + block_y.ravel()
+        far = (np.abs(sx - x[:, None]) > 1) | (np.abs(sy - y[:, None]) > 1)
+        far &= (sx >= 0) & (sx < side) & (sy >= 0) & (sy < side)
+        target = np.broadcast_to(occupied[:, None], far.shape)[far]
+        source = sx[far]*side + sy[far]
+        nonempty = mass[source] > 0
+        target, source = target[nonempty], source[nonempty]
+
+        #Force on each target centroid and its Jacobian, summed per target cell
+        delta = centroids[target] - centroids[source]
+        dist_sq = (delta ** 2).sum(axis=1)
+        scale = mass[source]*k*k / dist_sq
+        fx = np.bincount(target, weights=delta[:, 0]*scale, minlength=n_cells)
+        fy = np.bincount(target, weights=delta[:, 1]*scale, minlength=n_cells)
+        jxx = np.bincount(target, weights=scale*(1 - 2*delta[:, 0]**2/dist_sq), minlength=n_cells)
+        jyy = np.bincount(target, weights=scale*(1 - 2*delta[:, 1]**2/dist_sq), minlength=n_cells)
+        jxy = np.bincount(target, weights=-2*scale*delta[:, 0]*delta[:, 1]/dist_sq, minlength=n_cells)
+
+        offset = pos - centroids[cell_id]
+        disp[:, 0] += fx[cell_id] + jxx[cell_id]*offset[:, 0] + jxy[cell_id]*offset[:, 1]
+        disp[:, 1] += fy[cell_id] + jxy[cell_id]*offset[:, 0] + jyy[cell_id]*offset[:, 1]
+    return disp
+
+#Fruchterman-Reingold layout with Barnes-Hut style repulsion (see repulsion above)
+#Each iteration is O(n log n + m) instead of the O(n^2) of kamada_kawai
+#Pass the layout of an earlier version of the graph as previous (e.g. before edge removals) to
+#warm start from it: its nodes keep their positions and only small moves are made
+def force_layout(G, iterations=50, seed=0, k=None, previous=None):
+    nodes = list(G.nodes())
+    n = len(nodes)
+    if n == 0:
+        return {}
+    known = [] if previous is None else [i for i, node in enumerate(nodes) if node in previous]
+
+    key = (graph_hash(G), iterations, seed, k)
+    if len(known) > 0:
+        key += (hashlib.sha1(np.array([previous[nodes[i]] for i in known], dtype=float).tobytes()).hexdigest(),)
+    if key in layout_cache:
+        return layout_cache[key]
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in G.edges() if u != v], dtype=np.int64).reshape(-1, 2)
+
+    if k is None:
+        k = 1 / np.sqrt(n)
+
+    #Random start, then reuse the positions the previous layout gave
+    rng = np.random.default_rng(seed)
+    pos = rng.random((n, 2))
+    temperature = 0.1
+    if len(known) > 0:
+        pos[known] = [previous[nodes[i]] for i in known]
+        #Only small moves are needed when most of the layout is already settled
+        temperature *= max(1 - len(known)/n, 0.1)
+    cooling = temperature / (iterations + 1)
+
+    for it in range(iterations):
+        #Repulsion from every other node, approximated far away
+        disp = repulsion(pos, k)
+
+        #Attraction along edges: d^2 / k along the edge
+        if len(edges) > 0:
+            delta = pos[edges[:, 0]] - pos[edges[:, 1]]
+            dist = np.sqrt((delta ** 2).sum(axis=1))
+            force = delta * (dist / k)[:, None]
+            scatter_add(disp, edges[:, 0], -force)
+            scatter_add(disp, edges[:, 1], force)
+
+        #Limit each step by the current temperature
+        length = np.maximum(np.sqrt((disp ** 2).sum(axis=1)), 1e-9)
+        pos += disp * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+
+    layout = {node: pos[i] for i, node in enumerate(nodes)}
+    layout_cache[key] = layout
+    return layout
+
+#Draw edges as one LineCollection and nodes as one scatter, which stays fast for 10^5 nodes
+def draw_graph(G, pos, ax=None, node_size=10, node_color='C0', edge_color='k', edge_alpha=0.2, filename=None):
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(9, 9))
+    nodes = list(G.nodes())
+    coords = np.array([pos[node] for node in nodes]).reshape(-1, 2)
+    segments = np.array([(pos[u], pos[v]) for u, v in G.edges()]).reshape(-1, 2, 2)
+
+    ax.add_collection(LineCollection(segments, colors=edge_color, alpha=edge_alpha, linewidths=0.5, rasterized=True))
+    ax.scatter(coords[:, 0], coords[:, 1], s=node_size, c=node_color, zorder=2, rasterized=True)
+    ax.autoscale()
+    ax.set_axis_off()
+    if filename is not None:
+        ax.figure.savefig(filename, dpi=200, bbox_inches='tight')
+    return ax
@@ -0,0 +1,30 @@
+import os
+import sys
+import networkx as nx
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common import instrument
+
+#Establish graph using edges from the cleaned interaction DataFrame
+def interaction_graph(data):
+    edges = []
+    for i in range(len(data)):
+        edge = (data.id_A[i], data.id_B[i], data.weight[i])
+        edges.append(edge)
+
+    graph = nx.Graph()
+    graph.add_weighted_edges_from(edges)
+    return graph
+
+#Repeatedly remove the edge with the highest (sampled) edge betweenness; G is modified in place
+def cluster_edge_betweenness(iterations, G):
+    for i in range(iterations):
+        print('Iteration ', i+1 , ' of ', iterations)
+        with instrument.timer('edge_betweenness_iteration', iteration=i+1):
+            eb = nx.edge_betweenness_centrality(G, 10)
+            max_eb = max(eb, key=eb.get)
+            G.remove_edge(max_eb[0], max_eb[1])
+        instrument.count('edges_removed')
+        #Modularity of the current components costs a pass over the graph, so only compute it when recording
+        if instrument.enabled:
+            instrument.record('modularity', nx.community.modularity(G, nx.connected_components(G)), iteration=i+1)
+    return G
@@ -0,0 +1,23 @@
+import os
+import sys
+import pandas as pd
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.plotting import use_headless
+from graph_layout import force_layout, draw_graph
+from ppi_network import interaction_graph, cluster_edge_betweenness
+
+#Draw the full interaction network and the network after edge-betweenness removals headless
+#Kept out of digraph_construction.py so the centrality analysis does not pay for the layouts
+if __name__ == '__main__':
+    use_headless()
+    graph = interaction_graph(pd.read_csv('cleaned_data.csv'))
+
+    pos = force_layout(graph)
+    draw_graph(graph, pos, node_size=2, filename='images/basicgraph.png')
+    print('Saved images/basicgraph.png')
+
+    #Warm starts from the full layout, so only the nodes near removed edges move much
+    cluster_edge_betweenness(10, graph)
+    pos = force_layout(graph, previous=pos)
+    draw_graph(graph, pos, node_size=2, filename='images/eb_removals.png')
+    print('Saved images/eb_removals.png')
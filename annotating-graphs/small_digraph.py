@@ -1,11 +1,12 @@
 import pandas as pd 
 import networkx as nx
 import matplotlib.pyplot as plt
+from graph_layout import force_layout, draw_graph
 
 #Construct simple graph to show linkages
-smallgraph = nx.fast_gnp_random_graph(20, 0.3)
-plt.figure()
-nx.draw_kamada_kawai(smallgraph)
+smallgraph = nx.fast_gnp_random_graph(20, 0.3, seed=0)
+pos = force_layout(smallgraph)
+draw_graph(smallgraph, pos, node_size=60)
 plt.show()
 
 #Create adjacency matrix
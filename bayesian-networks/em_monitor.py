@@ -0,0 +1,151 @@
+import os
+import re
+import math
+import glob
+import time
+import struct
+import signal
+import subprocess
+
+#Follow a likelihood.tab file, reading only the lines appended since the last poll
+class LikelihoodLog:
+    def __init__(self, filename):
+        self.filename = filename
+        self.offset = 0
+        self.partial = ''
+        self.values = []
+
+    def poll(self):
+        if not os.path.exists(self.filename):
+            return []
+        with open(self.filename, 'rb') as f:
+            f.seek(self.offset)
+            text = f.read().decode()
+            self.offset = f.tell()
+        #Keep an unfinished last line until the rest of it is written
+        lines = (self.partial + text).split('\n')
+        self.partial = lines.pop()
+        new = [float(line) for line in lines if line.strip()]
+        self.values.extend(new)
+        return new
+
+#Log-likelihood stored at the start of a GMTK accumulator file, or None if it is not written yet
+def accumulator_likelihood(filename):
+    try:
+        with open(filename, 'rb') as f:
+            head = f.read(8)
+    except FileNotFoundError:
+        return None
+    if len(head) < 8:
+        return None
+    return struct.unpack('<d', head)[0]
+
+#Watch a training directory's accumulator and likelihood.ll, reporting each time a round finishes
+class RoundWatcher:
+    def __init__(self, traindir):
+        self.accumulator = os.path.join(traindir, 'accumulators', 'acc.0.0.bin')
+        self.likelihood = os.path.join(traindir, 'likelihood', 'likelihood.ll')
+        self.stamp = None
+        self.latest = None
+
+    def poll(self):
+        if not os.path.exists(self.accumulator):
+            return None
+        stat = os.stat(self.accumulator)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self.stamp:
+            return None
+        self.stamp = stamp
+        value = accumulator_likelihood(self.accumulator)
+        if value is not None:
+            self.latest = value
+        return value
+
+    def last_likelihood(self):
+        if not os.path.exists(self.likelihood):
+            return None
+        with open(self.likelihood) as f:
+            text = f.read().strip()
+        return float(text) if text else None
+
+#Relative improvement of each EM round over the previous one
+def relative_improvements(values):
+    return [(b - a) / abs(a) for a, b in zip(values[:-1], values[1:])]
+
+#Log-likelihoods of the finished rounds, cross-checking likelihood.tab against the accumulator
+#The accumulator is rewritten as soon as a round ends, so when its value is not the last line of
+#likelihood.tab the tab is one round behind and that round is counted from the accumulator
+def round_values(values, latest):
+    if latest is None or (values and math.isclose(values[-1], latest, rel_tol=1e-9)):
+        return values
+    return values + [latest]
+
+#Stop once the last `patience` rounds each improved the log-likelihood by less than tol (relative)
+def should_stop(values, tol=1e-4, patience=2):
+    improvements = relative_improvements(values)
+    return len(improvements) >= patience and all(x < tol for x in improvements[-patience:])
+
+#Round at which should_stop would have ended an already finished run
+def stopping_round(values, tol=1e-4, patience=2):
+    for i in range(1, len(values)+1):
+        if should_stop(values[:i], tol, patience):
+            return i
+    return len(values)
+
+#Newest per-round params file in a training directory (params.params is only written at the end)
+def latest_params(traindir):
+    final = os.path.join(traindir, 'params', 'params.params')
+    if os.path.exists(final):
+        return final
+    rounds = glob.glob(os.path.join(traindir, 'params', 'params.*.params.*'))
+    if len(rounds) == 0:
+        return None
+    return max(rounds, key=lambda name: int(re.search(r'\.(\d+)$', name).group(1)))
+
+#Run several random-restart trainings at once, stopping each when EM stops improving
+#command is a list of arguments where {traindir} and {seed} are filled in per restart; each run gets
+#its seed in SEGWAY_RAND_SEED and its own process group, so stopping it also stops its GMTK jobs
+def run_restarts(command, traindirs, seeds, tol=1e-4, patience=2, poll_interval=10):
+    runs = {}
+    for traindir, seed in zip(traindirs, seeds):
+        args = [arg.format(traindir=traindir, seed=seed) for arg in command]
+        env = dict(os.environ, SEGWAY_RAND_SEED=str(seed))
+        process = subprocess.Popen(args, env=env, start_new_session=True)
+        runs[traindir] = (process, LikelihoodLog(os.path.join(traindir, 'log', 'likelihood.tab')), RoundWatcher(traindir))
+
+    running = set(runs)
+    while running:
+        time.sleep(poll_interval)
+        for traindir in list(running):
+            process, log, watcher = runs[traindir]
+            new = log.poll()
+            finished = watcher.poll()
+            values = round_values(log.values, watcher.latest)
+            if process.poll() is not None:
+                running.remove(traindir)
+            elif (new or finished is not None) and should_stop(values, tol, patience):
+                print('Stopping', traindir, 'after', len(values), 'rounds')
+                os.killpg(process.pid, signal.SIGTERM)
+                process.wait()
+                running.remove(traindir)
+
+    #Pick up anything written after the last poll
+    values = {}
+    for traindir, (process, log, watcher) in runs.items():
+        log.poll()
+        watcher.poll()
+        values[traindir] = round_values(log.values, watcher.latest)
+    finished = [traindir for traindir in traindirs if values[traindir]]
+    best = max(finished, key=lambda traindir: values[traindir][-1]) if finished else None
+    return best, values
+
+if __name__ == '__main__':
+    #Replay the existing training run to see where early stopping would have ended it
+    log = LikelihoodLog('traindir/log/likelihood.tab')
+    values = log.poll()
+    for tol in [1e-3, 1e-4, 1e-5]:
+        print('tol', tol, ': stop after round', stopping_round(values, tol), 'of', len(values))
+    watcher = RoundWatcher('traindir')
+    print('Last round log-likelihood: accumulator', watcher.poll(), 'likelihood.ll', watcher.last_likelihood())
+    print('Rounds after cross-check:', len(round_values(values, watcher.latest)))
+    print('Latest params:', latest_params('traindir'))
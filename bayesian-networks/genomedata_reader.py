@@ -0,0 +1,78 @@
+from collections import OrderedDict
+import numpy as np
+
+#Windowed access to a genomedata archive with a bounded cache of asinh-transformed blocks
+#Uncompressed (contiguous) track arrays are memory-mapped straight from the file; compressed ones,
+#like test.genomedata, fall back to h5py slicing, which only decompresses the HDF5 chunks touched.
+class GenomedataReader:
+    def __init__(self, filename, block_size=65536, cache_blocks=256):
+        import h5py
+        self.filename = filename
+        self.file = h5py.File(filename, 'r')
+        self.tracknames = [name.decode() if isinstance(name, bytes) else str(name) for name in self.file.attrs['tracknames']]
+        self.block_size = block_size
+        self.cache_blocks = cache_blocks
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        #Sorted (start, end, array) supercontigs for each chromosome
+        self.supercontigs = {}
+        for chrom, group in self.file.items():
+            contigs = []
+            for supercontig in group.values():
+                contigs.append((int(supercontig.attrs['start']), int(supercontig.attrs['end']),
+                                self.track_array(supercontig['continuous'])))
+            self.supercontigs[chrom] = sorted(contigs, key=lambda contig: contig[0])
+
+    def track_array(self, dataset):
+        offset = dataset.id.get_offset()
+        if dataset.chunks is None and offset is not None:
+            return np.memmap(self.filename, mode='r', dtype=dataset.dtype, offset=offset, shape=dataset.shape)
+        return dataset
+
+    def close(self):
+        self.file.close()
+
+    #asinh-transformed float32 values of one track over one block; gaps are NaN
+    def block(self, track, chrom, block):
+        key = (track, chrom, block)
+        if key in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        self.misses += 1
+
+        column = self.tracknames.index(track)
+        start = block * self.block_size
+        end = start + self.block_size
+        values = np.full(self.block_size, np.nan, dtype=np.float32)
+        for sc_start, sc_end, array in self.supercontigs.get(chrom, []):
+            lo, hi = max(start, sc_start), min(end, sc_end)
+            if lo < hi:
+                values[lo-start:hi-start] = np.arcsinh(array[lo-sc_start:hi-sc_start, column])
+
+        self.cache[key] = values
+        if len(self.cache) > self.cache_blocks:
+            self.cache.popitem(last=False)
+        return values
+
+    #asinh-transformed signal for [start, end) on chrom, shape (end - start, tracks)
+    def signal(self, chrom, start, end, tracks=None):
+        if tracks is None:
+            tracks = self.tracknames
+        out = np.empty((end - start, len(tracks)), dtype=np.float32)
+        for first in range(start // self.block_size, (end - 1) // self.block_size + 1):
+            block_start = first * self.block_size
+            lo, hi = max(start, block_start), min(end, block_start + self.block_size)
+            for j, track in enumerate(tracks):
+                out[lo-start:hi-start, j] = self.block(track, chrom, first)[lo-block_start:hi-block_start]
+        return out
+
+    #Signal for every interval of a segway_bed.Segmentation (e.g. window.bed), keyed by (chrom, start, end)
+    def windows(self, bed, tracks=None):
+        signals = {}
+        for chrom_code, start, end in zip(bed.chrom_codes, bed.starts, bed.ends):
+            chrom = bed.chroms[chrom_code]
+            signals[(chrom, int(start), int(end))] = self.signal(chrom, int(start), int(end), tracks)
+        return signals
@@ -0,0 +1,122 @@
+import os
+import gzip
+import numpy as np
+
+#Open a plain or gzipped BED file as text
+def open_bed(filename):
+    if filename.endswith('.gz'):
+        return gzip.open(filename, 'rt')
+    return open(filename)
+
+#Count track/browser/comment lines at the top of a BED file, and the columns of its first row
+def header_lines(filename):
+    n = 0
+    columns = 0
+    with open_bed(filename) as f:
+        for line in f:
+            if not line.startswith(('track', 'browser', '#')):
+                columns = len(line.rstrip('\n').split('\t'))
+                break
+            n += 1
+    return n, columns
+
+#Parse 'chr21:9411193-9595548' into ('chr21', 9411193, 9595548)
+def parse_region(region):
+    chrom, span = region.replace(',', '').split(':')
+    start, end = span.split('-')
+    return chrom, int(start), int(end)
+
+#Columnar intervals sorted by (chromosome, start) with a per-chromosome index
+class Segmentation:
+    def __init__(self, chroms, chrom_codes, starts, ends, labels):
+        order = np.lexsort((starts, chrom_codes))
+        self.chroms = list(chroms)
+        self.chrom_codes = np.asarray(chrom_codes, dtype=np.int32)[order]
+        self.starts = np.asarray(starts, dtype=np.int64)[order]
+        self.ends = np.asarray(ends, dtype=np.int64)[order]
+        self.labels = np.asarray(labels, dtype=np.uint8)[order]
+
+        #Row range of each chromosome
+        bounds = np.searchsorted(self.chrom_codes, np.arange(len(self.chroms)+1))
+        self.offsets = {chrom: (bounds[i], bounds[i+1]) for i, chrom in enumerate(self.chroms)}
+
+        #Running maximum of ends within each chromosome, so overlapping intervals can be searched too
+        self.max_ends = np.empty_like(self.ends)
+        for lo, hi in self.offsets.values():
+            self.max_ends[lo:hi] = np.maximum.accumulate(self.ends[lo:hi])
+
+    def __len__(self):
+        return len(self.starts)
+
+    #Row indices of intervals overlapping [start, end) on chrom, found by binary search
+    def rows(self, chrom, start, end):
+        if chrom not in self.offsets:
+            return np.arange(0)
+        lo, hi = self.offsets[chrom]
+        first = lo + np.searchsorted(self.max_ends[lo:hi], start, side='right')
+        last = lo + np.searchsorted(self.starts[lo:hi], end, side='left')
+        candidates = np.arange(first, last)
+        return candidates[self.ends[first:last] > start]
+
+    #Starts, ends and labels of intervals overlapping a region
+    def query(self, chrom, start, end):
+        rows = self.rows(chrom, start, end)
+        return self.starts[rows], self.ends[rows], self.labels[rows]
+
+    def region(self, region):
+        return self.query(*parse_region(region))
+
+    def save(self, filename):
+        np.savez(filename, chroms=np.array(self.chroms), chrom_codes=self.chrom_codes,
+                 starts=self.starts, ends=self.ends, labels=self.labels)
+
+    @classmethod
+    def load(cls, filename):
+        arrays = np.load(filename)
+        return cls(arrays['chroms'].tolist(), arrays['chrom_codes'], arrays['starts'], arrays['ends'], arrays['labels'])
+
+#Stream a BED file in chunks into columnar arrays
+#The name column is read as a uint8 label (Segway writes labels 0-3 there) unless labels=False;
+#BED3 files have no name column, so their labels are all 0
+def read_bed(filename, labels=True, chunksize=1000000):
+    import pandas as pd
+    skip, columns = header_lines(filename)
+    labels = labels and columns >= 4
+    usecols = [0, 1, 2, 3] if labels else [0, 1, 2]
+    dtype = {0: str, 1: np.int64, 2: np.int64}
+    if labels:
+        dtype[3] = np.uint8
+
+    chroms = {}
+    parts = []
+    reader = pd.read_csv(filename, sep='\t', header=None, skiprows=skip,
+                         usecols=usecols, dtype=dtype, chunksize=chunksize)
+    for chunk in reader:
+        #Map this chunk's chromosome names onto global codes
+        names, codes = np.unique(chunk[0].to_numpy(), return_inverse=True)
+        lookup = np.array([chroms.setdefault(name, len(chroms)) for name in names], dtype=np.int32)
+        chunk_labels = chunk[3].to_numpy() if labels else np.zeros(len(chunk), dtype=np.uint8)
+        parts.append((lookup[codes], chunk[1].to_numpy(), chunk[2].to_numpy(), chunk_labels))
+
+    if len(parts) == 0:
+        return Segmentation([], np.zeros(0), np.zeros(0), np.zeros(0), np.zeros(0))
+    columns = [np.concatenate(column) for column in zip(*parts)]
+    return Segmentation(list(chroms), *columns)
+
+#Load a segmentation, reusing an .npz index next to the BED file when it is up to date
+def load_segmentation(filename, labels=True, cache=True):
+    cache_file = filename + '.npz'
+    if cache and os.path.exists(cache_file) and os.path.getmtime(cache_file) >= os.path.getmtime(filename):
+        return Segmentation.load(cache_file)
+    segmentation = read_bed(filename, labels)
+    if cache:
+        segmentation.save(cache_file)
+    return segmentation
+
+if __name__ == '__main__':
+    segmentation = load_segmentation('identifydir/segway.bed.gz')
+    windows = read_bed('identifydir/window.bed', labels=False)
+    for chrom_code, start, end in zip(windows.chrom_codes, windows.starts, windows.ends):
+        chrom = windows.chroms[chrom_code]
+        starts, ends, labels = segmentation.query(chrom, start, end)
+        print(chrom, start, end, len(starts), 'segments, labels', np.bincount(labels, minlength=4))
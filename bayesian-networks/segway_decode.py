@@ -0,0 +1,209 @@
+import os
+import re
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from segway_bed import read_bed
+from genomedata_reader import GenomedataReader
+
+#Segment lengths are only allowed to change at ruler marks (RULER_SCALE in segway.inc)
+RULER_SCALE = 10
+
+#Whitespace-separated tokens of a GMTK ascii file with % comments removed
+def gmtk_tokens(filename):
+    tokens = []
+    with open(filename) as f:
+        for line in f:
+            tokens.extend(line.split('%')[0].split())
+    return tokens
+
+#Read the dense CPTs, means and covariances from a GMTK params file
+def read_params(filename):
+    tokens = iter(gmtk_tokens(filename))
+
+    cpts = {}
+    for i in range(int(next(tokens))):
+        next(tokens)
+        name = next(tokens)
+        cards = [int(next(tokens)) for j in range(int(next(tokens)) + 1)]
+        values = [float(next(tokens)) for j in range(int(np.prod(cards)))]
+        cpts[name] = np.array(values).reshape(cards)
+
+    vectors = {}
+    for section in range(2):
+        for i in range(int(next(tokens))):
+            next(tokens)
+            name = next(tokens)
+            vectors[name] = np.array([float(next(tokens)) for j in range(int(next(tokens)))])
+    return cpts, vectors
+
+#Per-track weight scales from the structure file
+def read_track_weights(filename):
+    with open(filename) as f:
+        text = f.read()
+    return {name: float(scale) for name, scale in re.findall(r'variable: (\w+) \{[^}]*?weight: scale ([\d.eE+-]+)', text)}
+
+#Trained Segway model as an HMM over (segCountDown, seg) states
+#State index is countdown*n_labels + label. After a segment transition the countdown is 1 and it
+#only drops to 0 at the next ruler mark, which is when another transition becomes possible.
+class SegwayModel:
+    def __init__(self, params_filename, structure_filename, tracknames):
+        cpts, vectors = read_params(params_filename)
+        weights = read_track_weights(structure_filename)
+        self.tracknames = list(tracknames)
+        self.start = cpts['start_seg']
+        self.seg_seg = cpts['seg_seg']
+        self.seg_transition = cpts['segCountDown_seg_segTransition']
+        self.n_labels = len(self.start)
+        self.means = np.array([[vectors['mean_seg%d_subseg0_%s' % (s, track)][0] for track in self.tracknames]
+                               for s in range(self.n_labels)])
+        self.variances = np.array([vectors['covar_' + track][0] for track in self.tracknames])
+        self.weights = np.array([weights.get(track, 1.0) for track in self.tracknames])
+
+        n = self.n_labels
+        #Transition matrices into a frame without [0] and with [1] a ruler mark
+        A = np.zeros((2, 2*n, 2*n))
+        for ruler in range(2):
+            for countdown in range(2):
+                for s in range(n):
+                    change = self.seg_transition[countdown, s, 2]
+                    next_countdown = max(countdown - 1, 0) if ruler else countdown
+                    A[ruler, countdown*n + s, next_countdown*n + s] += 1 - change
+                    A[ruler, countdown*n + s, n:] += change * self.seg_seg[s]
+        with np.errstate(divide='ignore'):
+            self.log_A = np.log(A)
+            #Every segment starts with its countdown set to 1
+            self.log_start = np.log(np.concatenate([np.zeros(n), self.start]))
+
+    #Log-likelihood of every position under every state, from signal of shape (positions, tracks)
+    #Pass transformed=True for signal that is already asinh-transformed (e.g. from GenomedataReader)
+    #Missing (NaN) observations contribute nothing, as with Segway's presence variables
+    def log_emissions(self, signal, transformed=False):
+        x = np.asarray(signal, dtype=float)
+        if not transformed:
+            x = np.arcsinh(x)
+        x = x[:, None, :]
+        log_norm = -0.5 * (np.log(2*np.pi*self.variances) + (x - self.means) ** 2 / self.variances)
+        log_B = np.nansum(log_norm * self.weights, axis=2)
+        return np.tile(log_B, 2)
+
+def load_model(traindir='traindir', tracknames=('h3k27me3', 'h3k36me3')):
+    return SegwayModel(os.path.join(traindir, 'params', 'params.params'),
+                       os.path.join(traindir, 'segway.str'), tracknames)
+
+def ruler_marks(offset, length):
+    return ((offset + np.arange(length)) % RULER_SCALE == 0).astype(np.int64)
+
+#Most likely state path in log space, vectorized over states
+def viterbi(log_B, log_A, log_start, offset=0):
+    T, n = log_B.shape
+    rulers = ruler_marks(offset, T)
+    back = np.empty((T, n), dtype=np.int64)
+    states = np.arange(n)
+    delta = log_start + log_B[0]
+    for t in range(1, T):
+        scores = delta[:, None] + log_A[rulers[t]]
+        back[t] = scores.argmax(axis=0)
+        delta = scores[back[t], states] + log_B[t]
+    path = np.empty(T, dtype=np.int64)
+    path[-1] = delta.argmax()
+    for t in range(T-1, 0, -1):
+        path[t-1] = back[t, path[t]]
+    return path
+
+#Posterior state probabilities and log-likelihood by log-space forward-backward
+#Each step shifts by the running maximum before exponentiating, so nothing underflows
+def forward_backward(log_B, log_A, log_start, offset=0):
+    T, n = log_B.shape
+    rulers = ruler_marks(offset, T)
+    A = np.exp(log_A)
+    alpha = np.empty((T, n))
+    beta = np.empty((T, n))
+    with np.errstate(divide='ignore'):
+        alpha[0] = log_start + log_B[0]
+        for t in range(1, T):
+            m = alpha[t-1].max()
+            alpha[t] = np.log(np.exp(alpha[t-1] - m) @ A[rulers[t]]) + m + log_B[t]
+        beta[-1] = 0
+        for t in range(T-2, -1, -1):
+            x = beta[t+1] + log_B[t+1]
+            m = x.max()
+            beta[t] = np.log(A[rulers[t+1]] @ np.exp(x - m)) + m
+    m = alpha[-1].max()
+    log_likelihood = m + np.log(np.exp(alpha[-1] - m).sum())
+    posterior = np.exp(alpha + beta - log_likelihood)
+    return posterior, log_likelihood
+
+#Decode one chunk; chunks after the first start from a uniform state distribution
+def decode_chunk(task):
+    log_B, log_A, log_start, offset, posterior = task
+    if posterior:
+        return forward_backward(log_B, log_A, log_start, offset)[0]
+    return viterbi(log_B, log_A, log_start, offset)
+
+#Split positions into chunks with overlap on both sides; returns (decode range, kept range) pairs
+def chunk_bounds(length, chunk_size, overlap):
+    bounds = []
+    for start in range(0, length, chunk_size):
+        end = min(start + chunk_size, length)
+        bounds.append(((max(start - overlap, 0), min(end + overlap, length)), (start, end)))
+    return bounds
+
+#Decode several signals (e.g. one per chromosome or window) in parallel chunks
+#Each chunk is decoded with overlap on both sides and only its middle is kept, which stitches
+#the chunks back together. Returns labels, or per-label posteriors if posterior=True.
+def decode(model, signals, chunk_size=100000, overlap=2000, posterior=False, transformed=False, workers=None):
+    n = model.n_labels
+    uniform = np.full(2*n, -np.log(2*n))
+    tasks = []
+    keys = []
+    for name, signal in signals.items():
+        log_B = model.log_emissions(signal, transformed)
+        for (lo, hi), kept in chunk_bounds(len(log_B), chunk_size, overlap):
+            log_start = model.log_start if lo == 0 else uniform
+            tasks.append((log_B[lo:hi], model.log_A, log_start, lo, posterior))
+            keys.append((name, lo, kept))
+
+    if workers is None:
+        workers = min(len(tasks), os.cpu_count())
+    if workers <= 1:
+        results = [decode_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(decode_chunk, tasks))
+
+    decoded = {}
+    for name, signal in signals.items():
+        shape = (len(signal), n) if posterior else (len(signal),)
+        decoded[name] = np.empty(shape)
+    for (name, lo, (start, end)), result in zip(keys, results):
+        result = result[start-lo:end-lo]
+        if posterior:
+            decoded[name][start:end] = result.reshape(-1, 2, n).sum(axis=1)
+        else:
+            decoded[name][start:end] = result % n
+    if not posterior:
+        decoded = {name: labels.astype(np.uint8) for name, labels in decoded.items()}
+    return decoded
+
+#Write labels to an open file as run-length encoded BED rows
+def write_bed(f, chrom, start, labels):
+    changes = np.flatnonzero(np.diff(labels)) + 1
+    starts = np.concatenate([[0], changes])
+    ends = np.concatenate([changes, [len(labels)]])
+    for s, e in zip(starts, ends):
+        f.write('%s\t%d\t%d\t%d\n' % (chrom, start + s, start + e, labels[s]))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Viterbi-decode the identify windows with the trained Segway model.')
+    parser.add_argument('--output', default='local_viterbi.bed', help='BED file for the decoded labels')
+    args = parser.parse_args()
+
+    reader = GenomedataReader('test.genomedata')
+    signals = reader.windows(read_bed('identifydir/window.bed', labels=False))
+    model = load_model('traindir', reader.tracknames)
+    decoded = decode(model, signals, transformed=True)
+    with open(args.output, 'w') as f:
+        for (chrom, start, end), labels in decoded.items():
+            write_bed(f, chrom, start, labels)
+            print(chrom, start, end, 'label counts', np.bincount(labels, minlength=model.n_labels))
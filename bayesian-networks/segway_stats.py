@@ -0,0 +1,119 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from segway_bed import load_segmentation, read_bed
+
+#Segment lengths are histogrammed in powers of two: bin b holds lengths in [2^b, 2^(b+1))
+N_LENGTH_BINS = 64
+
+#Merge overlapping intervals into sorted disjoint ones
+def merge_intervals(starts, ends):
+    if len(starts) == 0:
+        return starts, ends
+    order = np.argsort(starts, kind='stable')
+    starts = starts[order]
+    ends = ends[order]
+    max_ends = np.maximum.accumulate(ends)
+    new = np.ones(len(starts), dtype=bool)
+    new[1:] = starts[1:] > max_ends[:-1]
+    first = np.flatnonzero(new)
+    return starts[first], np.maximum.reduceat(ends, first)
+
+#Number of bases covered by sorted disjoint intervals to the left of each position in x
+def covered_before(x, starts, ends):
+    if len(starts) == 0:
+        return np.zeros(len(x), dtype=np.int64)
+    lengths = ends - starts
+    cumulative = np.concatenate([[0], np.cumsum(lengths)])
+    i = np.searchsorted(starts, x, side='right')
+    prev = np.maximum(i - 1, 0)
+    partial = np.where(i > 0, np.clip(x - starts[prev], 0, lengths[prev]), 0)
+    return cumulative[prev] + partial
+
+#Coverage, counts, length histogram, transitions and annotation overlap for one window
+#Segments are clipped to [lo, hi); everything is computed with array sweeps, no per-segment loops
+def window_stats(task):
+    starts, ends, labels, lo, hi, ann_starts, ann_ends, n_labels = task
+    starts = np.maximum(starts, lo)
+    ends = np.minimum(ends, hi)
+    lengths = ends - starts
+    labels = labels.astype(np.int64)
+
+    coverage = np.bincount(labels, weights=lengths, minlength=n_labels)
+    counts = np.bincount(labels, minlength=n_labels)
+    bins = np.floor(np.log2(np.maximum(lengths, 1))).astype(np.int64)
+    length_hist = np.bincount(labels*N_LENGTH_BINS + bins, minlength=n_labels*N_LENGTH_BINS)
+
+    #Only count transitions between segments that touch
+    adjacent = ends[:-1] == starts[1:]
+    pairs = labels[:-1][adjacent]*n_labels + labels[1:][adjacent]
+    transitions = np.bincount(pairs, minlength=n_labels*n_labels)
+
+    ann_starts, ann_ends = merge_intervals(ann_starts, ann_ends)
+    ann_starts = np.clip(ann_starts, lo, hi)
+    ann_ends = np.clip(ann_ends, lo, hi)
+    overlap_bp = covered_before(ends, ann_starts, ann_ends) - covered_before(starts, ann_starts, ann_ends)
+    overlap = np.bincount(labels, weights=overlap_bp, minlength=n_labels)
+
+    return coverage, counts, length_hist.reshape(n_labels, N_LENGTH_BINS), transitions.reshape(n_labels, n_labels), overlap
+
+#Per-label statistics of a segmentation, optionally restricted to windows and compared to an annotation
+#segmentation, windows and annotation are segway_bed.Segmentation objects; windows are processed in parallel
+def summarize(segmentation, windows=None, annotation=None, n_labels=4, workers=None):
+    if windows is None:
+        #One window spanning each chromosome
+        regions = [(chrom, segmentation.starts[lo:hi].min(), segmentation.max_ends[hi-1])
+                   for chrom, (lo, hi) in segmentation.offsets.items() if hi > lo]
+    else:
+        regions = [(windows.chroms[c], s, e) for c, s, e in zip(windows.chrom_codes, windows.starts, windows.ends)]
+
+    tasks = []
+    empty = np.zeros(0, dtype=np.int64)
+    for chrom, lo, hi in regions:
+        rows = segmentation.rows(chrom, lo, hi)
+        if annotation is not None:
+            ann_rows = annotation.rows(chrom, lo, hi)
+            ann_starts, ann_ends = annotation.starts[ann_rows], annotation.ends[ann_rows]
+        else:
+            ann_starts, ann_ends = empty, empty
+        tasks.append((segmentation.starts[rows], segmentation.ends[rows], segmentation.labels[rows],
+                      lo, hi, ann_starts, ann_ends, n_labels))
+    #With no regions, sum over one empty window so every statistic comes back zero-filled
+    if len(tasks) == 0:
+        tasks.append((empty, empty, empty, 0, 0, empty, empty, n_labels))
+
+    if workers is None:
+        workers = min(len(tasks), os.cpu_count())
+    if workers <= 1:
+        results = [window_stats(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(window_stats, tasks))
+
+    coverage, counts, length_hist, transitions, overlap = [sum(column) for column in zip(*results)]
+    total = max(coverage.sum(), 1)
+    stats = {
+        'coverage': coverage,
+        'fraction': coverage / total,
+        'segments': counts,
+        'mean_length': coverage / np.maximum(counts, 1),
+        'length_hist': length_hist,
+        'transitions': transitions,
+    }
+    if annotation is not None:
+        #Fold enrichment: fraction of each label that is annotated over the fraction of all bases annotated
+        #Labels get an enrichment of 0 when nothing is annotated
+        stats['overlap'] = overlap
+        annotated = overlap.sum() / total
+        stats['enrichment'] = (overlap / np.maximum(coverage, 1)) / annotated if annotated > 0 else np.zeros(n_labels)
+    return stats
+
+if __name__ == '__main__':
+    segmentation = load_segmentation('identifydir/segway.bed.gz')
+    windows = read_bed('identifydir/window.bed', labels=False)
+    stats = summarize(segmentation, windows)
+    print('Coverage (bp):', stats['coverage'])
+    print('Fraction of window:', stats['fraction'])
+    print('Mean segment length:', stats['mean_length'])
+    print('Transitions:')
+    print(stats['transitions'])
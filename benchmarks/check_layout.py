@@ -0,0 +1,47 @@
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+import numpy as np
+from generators import interaction_graph
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'annotating-graphs'))
+from graph_layout import force_layout
+
+#PPI-like graphs (4 edges per node) at the sizes force_layout has to handle
+SIZES = [(10000, 40000), (100000, 400000)]
+
+#Area of the box holding the middle 90% of nodes in each direction, reported alongside the timings
+def spread(layout):
+    P = np.array(list(layout.values()))
+    return np.prod(np.percentile(P, 95, axis=0) - np.percentile(P, 5, axis=0))
+
+#Lay out each graph, failing if it needs more than max_memory bytes or max_seconds
+def check(sizes, max_memory, max_seconds, iterations=50):
+    failures = []
+    for n_nodes, n_edges in sizes:
+        graph = interaction_graph(n_nodes, n_edges)
+        tracemalloc.start()
+        start = time.perf_counter()
+        layout = force_layout(graph, iterations=iterations)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        area = spread(layout)
+        ok = peak <= max_memory and elapsed <= max_seconds
+        print('%7d nodes %7d edges  %6.1fs  peak %7.1f MB  spread %.2f  %s' %
+              (n_nodes, n_edges, elapsed, peak / 2**20, area, 'ok' if ok else 'FAILED'))
+        if not ok:
+            failures.append(n_nodes)
+    return failures
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check that force_layout stays bounded on large graphs.')
+    parser.add_argument('--max-memory', type=float, default=1024, help='peak traced memory budget in MB')
+    parser.add_argument('--max-seconds', type=float, default=300)
+    parser.add_argument('--iterations', type=int, default=50)
+    args = parser.parse_args()
+    failures = check(SIZES, args.max_memory * 2**20, args.max_seconds, args.iterations)
+    sys.exit(1 if failures else 0)
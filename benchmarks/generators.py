@@ -0,0 +1,46 @@
+import numpy as np
+
+#Sizes of the example datasets, used as the 1x scale
+EXPRESSION_GENES = 6150   #clustering-graphs/results/yeast_gene_interactions.csv
+CLEANED_GENES = 5909      #clustering-graphs/results/cleaned_data.csv
+PPI_NODES = 17000         #HIPPIE human interactome, roughly
+PPI_EDGES = 400000
+
+TIMEPOINTS = ['t:' + str(t) for t in range(0, 170, 10)]
+CLEANED_TIMEPOINTS = [t for t in TIMEPOINTS if t not in ['t:90', 't:100']]
+
+#Synthetic yeast time course with the layout of yeast_gene_interactions.csv
+def write_expression(filename, n_genes, seed=0):
+    import pandas as pd
+    rng = np.random.default_rng(seed)
+    values = rng.normal(0, 0.5, (n_genes, len(TIMEPOINTS))) + rng.normal(0, 0.3, (n_genes, 1))
+    data = pd.DataFrame(values, columns=TIMEPOINTS)
+    names = ['Y' + str(i).zfill(6) for i in range(n_genes)]
+    data.insert(0, 'GWEIGHT', 1)
+    data.insert(0, 'NAME', names)
+    data.insert(0, 'YORF', names)
+    weights = pd.DataFrame([['EWEIGHT', '', ''] + [1]*len(TIMEPOINTS)], columns=data.columns)
+    pd.concat([weights, data]).to_csv(filename, sep='\t', index=False)
+
+#Synthetic normalized expression matrix with the layout of cleaned_data.csv
+def write_cleaned(filename, n_genes, seed=0):
+    import pandas as pd
+    rng = np.random.default_rng(seed)
+    values = rng.normal(0, 1, (n_genes, len(CLEANED_TIMEPOINTS)))
+    values = (values - values.mean(axis=1, keepdims=True)) / values.std(axis=1, ddof=1, keepdims=True)
+    data = pd.DataFrame(values, columns=CLEANED_TIMEPOINTS)
+    data.insert(0, 'GWEIGHT', np.nan)
+    data.insert(0, 'NAME', np.nan)
+    data.insert(0, 'YORF', np.nan)
+    data['row_mean'] = np.nan
+    data['row_std'] = np.nan
+    data.to_csv(filename)
+
+#Random weighted interaction network of PPI-like size
+def interaction_graph(n_nodes, n_edges, seed=0):
+    import networkx as nx
+    rng = np.random.default_rng(seed)
+    graph = nx.gnm_random_graph(n_nodes, n_edges, seed=seed)
+    for (u, v), weight in zip(graph.edges(), rng.uniform(0, 1, graph.number_of_edges())):
+        graph[u][v]['weight'] = weight
+    return graph
@@ -0,0 +1,201 @@
+import os
+import sys
+import json
+import math
+import time
+import runpy
+import random
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+import tracemalloc
+from datetime import datetime, timezone
+from generators import (write_expression, write_cleaned, interaction_graph,
+                        EXPRESSION_GENES, CLEANED_GENES, PPI_NODES, PPI_EDGES)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for chapter in ['clustering-graphs', 'stochastic-modeling']:
+    sys.path.insert(0, os.path.join(ROOT, chapter))
+os.environ.setdefault('MPLBACKEND', 'Agg')
+#Time the computations themselves, not pipeline cache hits
+os.environ['PIPELINE_CACHE'] = 'off'
+
+#Each benchmark writes its synthetic inputs into workdir and returns the function to time
+
+def bench_kmeans(scale, workdir):
+    from k_means import cluster
+    write_cleaned('cleaned_data.csv', int(CLEANED_GENES*scale))
+    def run():
+        random.seed(0)
+        cluster(8)
+    return run
+
+def bench_agglomerative(scale, workdir):
+    from agglomerative import agglomerate, load_genes
+    write_cleaned('cleaned_data.csv', int(CLEANED_GENES*scale))
+    return lambda: agglomerate(load_genes())
+
+#The sweep solves max_n^2 trajectories, so max_n grows with the square root of the scale
+#odeint is imported here so the lazy import inside sweep is not timed
+def bench_master_equation(scale, workdir):
+    from scipy.integrate import odeint
+    from master_sweep import sweep
+    max_n = int(round(10*math.sqrt(scale)))
+    return lambda: sweep(max_n)
+
+def bench_betweenness(scale, workdir):
+    import networkx as nx
+    graph = interaction_graph(int(PPI_NODES*scale), int(PPI_EDGES*scale))
+    return lambda: nx.betweenness_centrality(graph, 50, seed=0)
+
+def bench_normalization(scale, workdir):
+    write_expression('yeast_gene_interactions.csv', int(EXPRESSION_GENES*scale))
+    script = os.path.join(ROOT, 'clustering-graphs', 'gene_expression_data_cleaning.py')
+    return lambda: runpy.run_path(script, run_name='__benchmark__')
+
+BENCHMARKS = {
+    'kmeans': bench_kmeans,
+    'agglomerative': bench_agglomerative,
+    'master_equation': bench_master_equation,
+    'betweenness': bench_betweenness,
+    'normalization': bench_normalization,
+}
+
+#Scales run when --scales is not given, chosen so the whole suite finishes in minutes
+SCALES = {
+    'kmeans': [0.1, 1, 10],
+    'agglomerative': [0.005, 0.01, 0.02],
+    'master_equation': [1, 10, 100],
+    'betweenness': [0.01, 0.1, 1],
+    'normalization': [1, 10, 100],
+}
+
+#Scales beyond which one run takes hours or its inputs do not fit in memory: agglomerative
+#clustering is a pure-Python loop over all pairs per merge, and betweenness builds a networkx graph
+MAX_SCALE = {
+    'agglomerative': 0.05,
+    'betweenness': 3,
+}
+
+#Why a scale should be skipped, or None to run it
+#Time and memory are extrapolated linearly from the previous scale, which underestimates the
+#superlinear benchmarks, so the budgets stop runaway scales rather than bound them exactly
+def skip_reason(name, scale, previous, runs, budget, max_memory):
+    if scale > MAX_SCALE.get(name, math.inf):
+        return 'above the maximum scale of %g' % MAX_SCALE[name]
+    if previous is not None:
+        ratio = scale / previous['scale']
+        if previous['median'] * ratio * runs > budget:
+            return 'projected time over the %gs budget' % budget
+        if previous['peak_memory_bytes'] * ratio > max_memory:
+            return 'projected memory over the %g MB budget' % (max_memory / 2**20)
+    return None
+
+#Time repeated runs, then do one extra run under tracemalloc for peak memory
+def measure(run, repeats, warmup):
+    for i in range(warmup):
+        run()
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'times': times,
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.mean(times),
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+        'peak_memory_bytes': peak,
+    }
+
+#Run one benchmark at one scale inside a scratch directory
+def run_benchmark(name, scale, repeats, warmup):
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            run = BENCHMARKS[name](scale, workdir)
+            result = measure(run, repeats, warmup)
+        finally:
+            os.chdir(cwd)
+    result.update({'benchmark': name, 'scale': scale, 'repeats': repeats})
+    return result
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+#Median time ratio (new / old) for every benchmark and scale found in both runs
+def compare(old, new, threshold=0.1):
+    old_results = {(r['benchmark'], r['scale']): r for r in old['results']}
+    regressions = []
+    for r in new['results']:
+        key = (r['benchmark'], r['scale'])
+        if 'skipped' in r or key not in old_results or 'skipped' in old_results[key]:
+            continue
+        ratio = r['median'] / old_results[key]['median']
+        memory = r['peak_memory_bytes'] / max(old_results[key]['peak_memory_bytes'], 1)
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  REGRESSION'
+            regressions.append(key)
+        print('%-16s %6gx  time %.3fx  memory %.3fx%s' % (key[0], key[1], ratio, memory, flag))
+    return regressions
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Time the hot paths of the analysis scripts on synthetic data.')
+    parser.add_argument('--benchmarks', nargs='+', default=list(BENCHMARKS), choices=list(BENCHMARKS))
+    parser.add_argument('--scales', nargs='+', type=float,
+                        help='dataset sizes relative to the example data (default: per benchmark)')
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--budget', type=float, default=600, help='seconds allowed per benchmark and scale')
+    parser.add_argument('--max-memory', type=float, default=2048, help='peak memory allowed in MB')
+    parser.add_argument('--output', help='JSON file for results (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', help='earlier results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.1, help='relative slowdown reported as a regression')
+    args = parser.parse_args()
+
+    commit = git_commit()
+    results = []
+    runs = args.warmup + args.repeats + 1
+    for name in args.benchmarks:
+        previous = None
+        for scale in sorted(args.scales or SCALES[name]):
+            reason = skip_reason(name, scale, previous, runs, args.budget, args.max_memory * 2**20)
+            if reason is not None:
+                print('Skipping', name, 'at', str(scale) + 'x:', reason)
+                results.append({'benchmark': name, 'scale': scale, 'skipped': reason})
+                continue
+            print('Running', name, 'at', str(scale) + 'x')
+            result = run_benchmark(name, scale, args.repeats, args.warmup)
+            print('  median %.4fs  stdev %.4fs  peak %.1f MB' % (result['median'], result['stdev'], result['peak_memory_bytes'] / 2**20))
+            results.append(result)
+            previous = result
+
+    report = {
+        'commit': commit,
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    output = args.output or os.path.join(ROOT, 'benchmarks', 'results', commit + '.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print('Saved', output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        sys.exit(1 if regressions else 0)
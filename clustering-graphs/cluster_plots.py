@@ -1,26 +1,56 @@
-import pandas as pd 
-from k_means import cluster
+from k_means import cached_cluster, load_genes
 import numpy as np
 from matplotlib import pyplot as plt
-from matplotlib.animation import FuncAnimation
+from matplotlib.animation import FuncAnimation, FFMpegWriter
+from matplotlib.collections import LineCollection
 
-normalized_data = pd.read_csv('cleaned_data.csv')
-centroid_data = cluster(15)
+#Project genes and every centroid frame onto the first two principal components
+#The projection is computed once from the data and applied to all frames in one product
+def project(data, centroid_data):
+    X = np.asarray(data, dtype=float)
+    mean = X.mean(axis=0)
+    _, _, Vt = np.linalg.svd(X - mean, full_matrices=False)
+    components = Vt[:2].T
+    return (X - mean) @ components, (centroid_data - mean) @ components
 
-fig = plt.figure()
-ax = plt.axes(xlim=(0, 4), ylim=(-2, 2))
+#Animate centroid convergence; only the centroid artists are redrawn each frame (blitting)
+#Frames are piped to ffmpeg as they are drawn, so memory does not grow with the number of frames
+def animate_clusters(data, labels, centroid_data, filename=None, fps=5):
+    points, frames = project(data, centroid_data)
 
-line, = ax.plot([], [], lw=3)
+    fig, ax = plt.subplots(figsize=(8, 6))
+    ax.scatter(points[:, 0], points[:, 1], c=labels, cmap='tab20', s=4, alpha=0.3)
+    everything = np.vstack([points, frames.reshape(-1, 2)])
+    ax.set_xlim(everything[:, 0].min(), everything[:, 0].max())
+    ax.set_ylim(everything[:, 1].min(), everything[:, 1].max())
+    ax.set_xlabel('PC 1')
+    ax.set_ylabel('PC 2')
 
-centroids, = ax.plot([], [], 'bo', ms=6)
+    trails = LineCollection([], colors='k', linewidths=1, alpha=0.5)
+    ax.add_collection(trails)
+    centroids, = ax.plot([], [], 'ko', ms=6)
+    iteration = ax.text(0.02, 0.95, '', transform=ax.transAxes)
 
-def init():
-    centroids.set_data([], [])
-    return centroids,
-def animate(i):
-    x = np.linspace(0, 4, 1000)
-    y = np.sin(2 * np.pi * (x - 0.01 * i))
-    line.set_data(x, y)
-    return line,
+    def init():
+        centroids.set_data([], [])
+        trails.set_segments([])
+        iteration.set_text('')
+        return centroids, trails, iteration
 
-anim = FuncAnimation(fig, animate, init_func=init, frames=200, interval=20, blit=True)
\ No newline at end of file
+    def animate(i):
+        centroids.set_data(frames[i, :, 0], frames[i, :, 1])
+        trails.set_segments(frames[:i+1].transpose(1, 0, 2))
+        iteration.set_text('Iteration ' + str(i))
+        return centroids, trails, iteration
+
+    anim = FuncAnimation(fig, animate, init_func=init, frames=len(frames), interval=1000/fps,
+                         blit=True, cache_frame_data=False)
+    if filename is not None:
+        anim.save(filename, writer=FFMpegWriter(fps=fps))
+    return anim
+
+k = 15
+centroid_data, labels = cached_cluster(k)
+data = load_genes()
+
+anim = animate_clusters(data, labels, centroid_data, 'cluster_evolution'+str(k)+'.mp4')
@@ -1,29 +1,22 @@
-import pandas as pd
-from k_means import cluster, update, assign
-from scipy.spatial.distance import cdist
-import numpy as np
-import matplotlib.pyplot as plt
+from k_means import cached_cluster, load_genes
 
 
 ks = [4, 6, 8, 10, 12, 14, 16]
 
+#Clusterings are cached, so re-running only recomputes the ones whose inputs changed
+genes = load_genes().to_numpy()
 distortions = []
 for k in ks:
     print('Number of Clusters:', k)
     print('Clustering...')
-    centroids = cluster(k)
-    data = pd.read_csv('result_data'+str(k)+'.csv')
+    centroids, labels = cached_cluster(k)
     print('Clustering complete! Calculating distortion...')
-    distances = []
-    for i in range(len(data)):
-        centroid = centroids[-1][int(data.iloc[i].closest)]
-        datapt = data.loc[i, 't:0':'t:160'].to_list()
-        distance = sum([(a - b) ** 2 for a, b in zip(centroid, datapt)])
-        distances.append(distance)
-    distortion = sum(distances)/len(data)
+    distortion = ((genes - centroids[-1][labels]) ** 2).sum(axis=1).mean()
     distortions.append(distortion)
     print('Distortion', distortion)
 
+#Plotting is only imported once the distortions are computed
+import matplotlib.pyplot as plt
 plt.figure()
 plt.plot(ks, distortions, label='Distortion')
 plt.legend(loc='best')
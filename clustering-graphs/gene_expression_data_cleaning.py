@@ -1,4 +1,8 @@
+import os
+import sys
 import pandas as pd
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.cache import PipelineCache
 
 #Read in gene interaction data
 raw_data = pd.read_csv('yeast_gene_interactions.csv',sep='\t')
@@ -16,14 +20,16 @@ cleaned_data['row_std'] = cleaned_data.loc[: , "t:0":"t:160"].std(axis=1)
 cutoff = cleaned_data.row_std.mean() - cleaned_data.row_std.std()*2
 cleaned_data = cleaned_data.loc[cleaned_data.row_std > cutoff]
 
-#Normalize gene vectors 
-normalized_data = cleaned_data
-for i in range(len(cleaned_data)):
-    gene_vector = cleaned_data.iloc[i]['t:0':'t:160']
-    new_vector = (gene_vector - gene_vector.mean() ) / gene_vector.std()
-    normalized_data.iloc[i] = new_vector
-normalized_data['NAME'] = cleaned_data.NAME
-normalized_data['YORF'] = cleaned_data.YORF
-normalized_data['GWEIGHT'] = cleaned_data.GWEIGHT
+#Normalize gene vectors, reusing the result of an earlier run on the same data with this script
+def normalize():
+    gene_vectors = cleaned_data.loc[:, "t:0":"t:160"]
+    normalized = gene_vectors.sub(gene_vectors.mean(axis=1), axis=0).div(gene_vectors.std(axis=1), axis=0)
+    return {'matrix': normalized.to_numpy()}
+
+cache = PipelineCache()
+matrix = cache.cached('normalize', normalize, inputs=['yeast_gene_interactions.csv'],
+                      code=[os.path.abspath(__file__)])['matrix']
+normalized_data = cleaned_data.copy()
+normalized_data.loc[:, "t:0":"t:160"] = matrix
 
 normalized_data.to_csv('cleaned_data.csv')
\ No newline at end of file
@@ -1,10 +1,16 @@
-import pandas as pd
+import os
+import sys
 import random
 import math
+import numpy as np
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common import instrument
+from common.cache import PipelineCache
 
 #Assign all genes to a cluster using Euclidean distance
 def assign(data, centroids):
     categories = []
+    inertia = 0
     for i in range(len(data)):
         datapt = data.iloc[i]
         min_distance = 800000
@@ -15,6 +21,9 @@ def assign(data, centroids):
                 min_distance = distance
                 category = j
         categories.append(category)
+        inertia += min_distance ** 2
+    instrument.count('kmeans_distance_evaluations', len(data)*len(centroids))
+    instrument.record('kmeans_inertia', inertia)
     return categories
 
 
@@ -32,12 +41,11 @@ def update(data, centroids, k):
         centroids[j] = coord
     return diffs, centroids
 
-def cluster(k):
-    normalized_data = pd.read_csv('cleaned_data.csv')
-
+#Cluster the gene vectors in data into k groups, adding each gene's label as data['closest']
+#Returns the centroid trajectory as an (iterations, k, dims) array; the last entry holds the final centroids
+def kmeans(data, k, capacity=64):
     #Initialize random centroids (set parameter k)
     centroids = []
-    data = normalized_data.loc[1:, 't:0':'t:160']
     for j in range(k):
         coord = []
         for i in data:
@@ -45,28 +53,58 @@ def cluster(k):
             coord.append(r)
         centroids.append(coord)
 
+    #Preallocate the centroid trajectory, doubling it only if we run out of room
+    #Frame 0 holds the random starting centroids and frame i the centroids after the i-th update
+    centroid_data = np.empty((max(capacity, 2), k, len(centroids[0])))
+    centroid_data[0] = centroids
+
     #Iterate to repeatedly assign and update
     categories = assign(data, centroids)
     data['closest'] = categories
     diffs, centroids = update(data, centroids, k)
-
-    centroid_data = [centroids]
+    centroid_data[1] = centroids
     print(centroids)
     count = 0
-    while(max([max(diffs[i]) for i in range(k)]) > 0.05):
+    shift = max([max(diffs[i]) for i in range(k)])
+    while(shift > 0.05):
         count+=1
         print('Iteration', count)
-        categories = assign(data, centroids)
-        data['closest'] = categories
-        diffs, centroids = update(data, centroids, k)
-        #centroid_data.append(centroids)
-    data.to_csv('result_data'+str(k)+'.csv')
-    #centroid_data.to_csv('centroid_result_data'+str(k)+'.csv')
-
-    return centroids
-
-
-    
+        with instrument.timer('kmeans_iteration', k=k, iteration=count):
+            categories = assign(data, centroids)
+            data['closest'] = categories
+            diffs, centroids = update(data, centroids, k)
+        shift = max([max(diffs[i]) for i in range(k)])
+        instrument.record('kmeans_max_centroid_shift', shift, k=k, iteration=count)
+        if count+1 == len(centroid_data):
+            centroid_data = np.concatenate([centroid_data, np.empty_like(centroid_data)])
+        centroid_data[count+1] = centroids
+    return centroid_data[:count+2]
 
+#Gene vectors of cleaned_data.csv in the order they are clustered
+def load_genes():
+    import pandas as pd
+    normalized_data = pd.read_csv('cleaned_data.csv')
+    return normalized_data.loc[1:, 't:0':'t:160']
 
+#Cluster genes into k groups, saving the labelled genes to result_data{k}.csv
+def cluster(k, capacity=64):
+    data = load_genes()
+    centroid_data = kmeans(data, k, capacity)
+    data.to_csv('result_data'+str(k)+'.csv')
+    return centroid_data
 
+#Cluster genes into k groups, reusing an earlier run on the same cleaned_data.csv with the same k,
+#seed and k_means.py; with seed=None the first run's random start is the one kept
+#Returns (centroid trajectory, label of each gene from load_genes())
+def cached_cluster(k, seed=None, cache=None):
+    if cache is None:
+        cache = PipelineCache()
+    def compute():
+        if seed is not None:
+            random.seed(seed)
+        data = load_genes()
+        centroid_data = kmeans(data, k)
+        return {'centroids': centroid_data, 'labels': data.closest.to_numpy()}
+    result = cache.cached('kmeans', compute, inputs=['cleaned_data.csv'], params={'k': k, 'seed': seed},
+                          code=[os.path.abspath(__file__)])
+    return result['centroids'], result['labels']
@@ -0,0 +1,107 @@
+import os
+import json
+import hashlib
+import zipfile
+import numpy as np
+from common import instrument
+
+#Content-addressed cache for intermediate pipeline results (cleaned matrices, labels, centroids, ...)
+#A stage's key hashes the content of its input files, its parameters and the source files of the code
+#that computes it, so changing any of them gives a new key and stale results are never reused.
+#Results are stored as .npz files; once the directory grows past max_bytes the least recently used
+#ones are removed. Set PIPELINE_CACHE to another directory, or to 'off' to always recompute.
+DEFAULT_DIR = '.pipeline_cache'
+DEFAULT_MAX_BYTES = 2**30
+
+#Hashes of files already read, keyed by (path, size, mtime) so unchanged files are not read again
+file_hashes = {}
+
+def file_hash(filename):
+    stat = os.stat(filename)
+    stamp = (os.path.abspath(filename), stat.st_size, stat.st_mtime_ns)
+    if stamp not in file_hashes:
+        digest = hashlib.sha256()
+        with open(filename, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        file_hashes[stamp] = digest.hexdigest()
+    return file_hashes[stamp]
+
+#Key for one stage run: inputs and code are lists of filenames, params anything JSON can describe
+def stage_key(stage, inputs=(), params=None, code=()):
+    description = {
+        'stage': stage,
+        'inputs': [file_hash(filename) for filename in inputs],
+        'params': params or {},
+        'code': [file_hash(filename) for filename in code],
+    }
+    text = json.dumps(description, sort_keys=True, default=repr)
+    return stage + '-' + hashlib.sha256(text.encode()).hexdigest()[:32]
+
+class PipelineCache:
+    def __init__(self, directory=None, max_bytes=None):
+        if directory is None:
+            directory = os.environ.get('PIPELINE_CACHE', DEFAULT_DIR)
+        if max_bytes is None:
+            max_bytes = int(os.environ.get('PIPELINE_CACHE_BYTES', DEFAULT_MAX_BYTES))
+        self.enabled = directory != 'off'
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.npz')
+
+    #Stored arrays for key, or None; a hit refreshes the file's mtime, which is what eviction goes by
+    def load(self, key):
+        path = self.path(key)
+        try:
+            with np.load(path, allow_pickle=False) as f:
+                arrays = {name: f[name] for name in f.files}
+            os.utime(path)
+        except (OSError, ValueError, zipfile.BadZipFile):
+            return None
+        return arrays
+
+    #Write to a temporary file first so an interrupted run never leaves a truncated entry behind
+    def save(self, key, arrays):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(key)
+        temp = '%s.%d.tmp' % (path, os.getpid())
+        with open(temp, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(temp, path)
+        self.evict()
+
+    #Remove least recently used entries until the cache fits in max_bytes
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.npz'):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime_ns, stat.st_size, name))
+        total = sum(size for mtime, size, name in entries)
+        for mtime, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.directory, name))
+            total -= size
+
+    #Arrays from an earlier run of this stage with the same inputs, params and code, or from compute()
+    #compute takes no arguments and returns a dict of arrays
+    def cached(self, stage, compute, inputs=(), params=None, code=()):
+        if not self.enabled:
+            return {name: np.asarray(value) for name, value in compute().items()}
+        key = stage_key(stage, inputs, params, code)
+        arrays = self.load(key)
+        if arrays is not None:
+            self.hits += 1
+            instrument.count('pipeline_cache_hits')
+            print('Using cached', stage, 'results')
+            return arrays
+        self.misses += 1
+        instrument.count('pipeline_cache_misses')
+        arrays = {name: np.asarray(value) for name, value in compute().items()}
+        self.save(key, arrays)
+        return arrays
@@ -0,0 +1,120 @@
+import os
+import json
+import time
+import atexit
+import functools
+
+#Lightweight timers, counters and metrics for the iterative algorithms
+#Everything is off unless enable() is called or INSTRUMENT_LOG / INSTRUMENT_METRICS are set, and
+#while off each call is a single flag check, so hooks can stay in hot loops.
+enabled = False
+log_file = None
+metrics_path = None
+counters = {}
+timers = {}
+gauges = {}
+
+#Start recording; log gets one JSON event per line, metrics gets a Prometheus text file at exit
+def enable(log=None, metrics=None):
+    global enabled, log_file, metrics_path
+    if log is not None:
+        log_file = open(log, 'a')
+    metrics_path = metrics
+    enabled = True
+
+def disable():
+    global enabled, log_file
+    enabled = False
+    if log_file is not None:
+        log_file.close()
+        log_file = None
+
+def emit(event, name, **fields):
+    if log_file is not None:
+        fields.update({'time': time.time(), 'event': event, 'name': name})
+        log_file.write(json.dumps(fields, default=float) + '\n')
+
+#Add n to a counter (distance evaluations, RHS calls, edges removed, ...)
+def count(name, n=1):
+    if not enabled:
+        return
+    counters[name] = counters.get(name, 0) + n
+
+#Record the latest value of a convergence metric (centroid shift, inertia, modularity, ...)
+def record(name, value, **labels):
+    if not enabled:
+        return
+    gauges[name] = value
+    emit('metric', name, value=value, **labels)
+
+class Timer:
+    def __init__(self, name, labels):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        total, calls = timers.get(self.name, (0.0, 0))
+        timers[self.name] = (total + elapsed, calls + 1)
+        emit('timer', self.name, seconds=elapsed, **self.labels)
+        return False
+
+class NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_TIMER = NullTimer()
+
+#Time a block: with timer('kmeans_iteration', iteration=i): ...
+def timer(name, **labels):
+    if not enabled:
+        return NULL_TIMER
+    return Timer(name, labels)
+
+#Time every call of a function
+def timed(name):
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return function(*args, **kwargs)
+            with Timer(name, {}):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+#Counters, timer totals and latest metric values in Prometheus text format
+def prometheus_text():
+    lines = []
+    for name, value in sorted(counters.items()):
+        lines += ['# TYPE %s_total counter' % name, '%s_total %s' % (name, value)]
+    for name, (total, calls) in sorted(timers.items()):
+        lines += ['# TYPE %s_seconds summary' % name, '%s_seconds_count %d' % (name, calls),
+                  '%s_seconds_sum %.9f' % (name, total)]
+    for name, value in sorted(gauges.items()):
+        lines += ['# TYPE %s gauge' % name, '%s %s' % (name, float(value))]
+    return '\n'.join(lines) + '\n'
+
+def write_metrics(path=None):
+    path = path or metrics_path
+    if path is None:
+        return
+    with open(path, 'w') as f:
+        f.write(prometheus_text())
+
+@atexit.register
+def finish():
+    if enabled:
+        write_metrics()
+        if log_file is not None:
+            log_file.flush()
+
+if os.environ.get('INSTRUMENT_LOG') or os.environ.get('INSTRUMENT_METRICS'):
+    enable(os.environ.get('INSTRUMENT_LOG'), os.environ.get('INSTRUMENT_METRICS'))
@@ -0,0 +1,28 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+#Select the non-interactive Agg backend before pyplot is imported
+def use_headless():
+    import matplotlib
+    matplotlib.use('Agg')
+
+#Draw one figure and save it, closing it so workers do not accumulate figures
+def render_one(job):
+    import matplotlib.pyplot as plt
+    draw, args, filename = job
+    fig = draw(*args)
+    fig.savefig(filename, dpi=150, bbox_inches='tight')
+    plt.close(fig)
+    return filename
+
+#Render (draw, args, filename) jobs into files across a pool of headless workers
+#draw must be a module-level function returning a matplotlib Figure
+def render_batch(jobs, workers=None):
+    jobs = list(jobs)
+    if workers is None:
+        workers = min(len(jobs), os.cpu_count())
+    if workers <= 1:
+        use_headless()
+        return [render_one(job) for job in jobs]
+    with ProcessPoolExecutor(workers, initializer=use_headless) as pool:
+        return list(pool.map(render_one, jobs))
@@ -1,6 +1,6 @@
-import matplotlib.pyplot as plt
 import numpy as np
-from scipy.integrate import odeint
+from de_models import autoregulation, solve
+from de_plots import plot_concentrations
 
 #Establish constants 
 c = 0.1
@@ -11,27 +11,11 @@ d = 0.025
 initial_concs = [2, 0, 0]
 
 #Calculate concentrations
-
-def get_concs(C, t):
-    G, T, P = C
-    dGdt = -d*P
-    dTdt = c*G - v*T
-    dPdt = k*T - u*P
-    return [dGdt, dTdt, dPdt]
-
 times = np.linspace(0., 200., 101)
-ans = odeint(func=get_concs, y0=initial_concs, t=times)
+ans = solve(autoregulation, initial_concs, times, c, k, v, u, d)
 Gs = ans[:, 0]
 Ts = ans[:, 1]
 Ps = ans[:, 2]
 
 
-fig, ax = plt.subplots()
-ax.plot(times, Gs, label='DNA')
-ax.plot(times, Ts, label='RNA')
-ax.plot(times, Ps, label='Protein')
-ax.legend()
-ax.set_xlabel('Time, hrs')
-ax.set_ylabel('Number of molecules in the cell')
-plt.grid()
-ax.set_ylim([0, 5])
+fig = plot_concentrations(times, ans, ylim=[0, 5])
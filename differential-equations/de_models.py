@@ -0,0 +1,40 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common import instrument
+
+#Right-hand sides for the central dogma models: G (DNA), T (RNA), P (protein)
+
+#Transcription and translation only
+def basic(C, t, c, k):
+    G, T, P = C
+    dGdt = 0
+    dTdt = c*G
+    dPdt = k*T
+    return [dGdt, dTdt, dPdt]
+
+#Transcription and translation with RNA and protein degradation
+def degradation(C, t, c, k, v, u):
+    G, T, P = C
+    dGdt = 0
+    dTdt = c*G - v*T
+    dPdt = k*T - u*P
+    return [dGdt, dTdt, dPdt]
+
+#Degradation model where protein represses its own gene
+def autoregulation(C, t, c, k, v, u, d):
+    G, T, P = C
+    dGdt = -d*P
+    dTdt = c*G - v*T
+    dPdt = k*T - u*P
+    return [dGdt, dTdt, dPdt]
+
+#Integrate a model over times; scipy is only imported when a model is solved
+def solve(model, initial_concs, times, *params):
+    from scipy.integrate import odeint
+    if not instrument.enabled:
+        return odeint(func=model, y0=initial_concs, t=times, args=params)
+    with instrument.timer('ode_solve', model=model.__name__):
+        ans, info = odeint(func=model, y0=initial_concs, t=times, args=params, full_output=True)
+    instrument.count('ode_rhs_calls', int(info['nfe'][-1]))
+    return ans
@@ -0,0 +1,21 @@
+from de_models import solve
+
+#Plot DNA, RNA and protein trajectories
+def plot_concentrations(times, ans, ylim=None):
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots()
+    ax.plot(times, ans[:, 0], label='DNA')
+    ax.plot(times, ans[:, 1], label='RNA')
+    ax.plot(times, ans[:, 2], label='Protein')
+    ax.legend()
+    ax.set_xlabel('Time, hrs')
+    ax.set_ylabel('Number of molecules in the cell')
+    ax.grid()
+    if ylim is not None:
+        ax.set_ylim(ylim)
+    return fig
+
+#Solve a model and plot it, so batch rendering also parallelizes the integration
+def model_figure(model, initial_concs, times, params, ylim=None):
+    ans = solve(model, initial_concs, times, *params)
+    return plot_concentrations(times, ans, ylim)
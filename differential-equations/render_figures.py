@@ -0,0 +1,18 @@
+import os
+import sys
+import numpy as np
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.plotting import render_batch
+from de_models import basic, degradation, autoregulation
+from de_plots import model_figure
+
+#Solve and draw every trajectory plot headless, one worker per figure
+if __name__ == '__main__':
+    initial_concs = [2, 0, 0]
+    jobs = [
+        (model_figure, (basic, initial_concs, np.linspace(0., 100., 101), (0.1, 0.1)), 'images/de_basic_plot.png'),
+        (model_figure, (degradation, initial_concs, np.linspace(0., 200., 101), (0.1, 0.1, 0.05, 0.05)), 'images/de_deg_plot.png'),
+        (model_figure, (autoregulation, initial_concs, np.linspace(0., 200., 101), (0.1, 0.1, 0.05, 0.05, 0.025), [0, 5]), 'images/de_autoreg_plot.png'),
+    ]
+    for filename in render_batch(jobs):
+        print('Saved', filename)
@@ -0,0 +1,15 @@
+from math import exp
+
+#Logistic growth rate r*n*(1 - n/K) at each population in pops
+def phase_portrait(pops, r, K):
+    n_dot = []
+    for n in pops:
+        n_dot.append(r*n*(1-(n/K)))
+    return n_dot
+
+#Logistic time series from population n_zero at t=0
+def logistic(times, r, K, n_zero):
+    n = []
+    for t in times:
+        n.append(K/(1+(K-n_zero)/n_zero*exp(-r*t)))
+    return n
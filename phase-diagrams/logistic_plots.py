@@ -0,0 +1,39 @@
+import numpy as np
+from logistic_model import phase_portrait, logistic
+
+#Phase portrait of the logistic model with its flows and fixed points
+def phase_portrait_figure(r, K):
+    import matplotlib.pyplot as plt
+    pops = np.linspace(0., (5*K)/4)
+    fig = plt.figure()
+    ax = plt.axes(xlim=(0,1.25*K), ylim=(-0.25*r*K,0.3*r*K))
+    ax.plot(pops, phase_portrait(pops, r, K))
+
+    # Plot trajectories
+    ax.arrow(0,0,K,0,length_includes_head=True,color='red',head_width=0.02,head_length=0.3)
+    ax.arrow(1.25*K,0,-0.25*K,0,length_includes_head=True,color='red',head_width=0.02,head_length=0.3)
+
+    # Plot fixed points
+    ax.plot(0,0,'go')
+    ax.plot(K,0,'go')
+
+    # Turn on the grid
+    ax.grid()
+    ax.set_xlabel("Stock")
+    ax.set_ylabel("Growth")
+    return fig
+
+#One logistic time series for each initial value, side by side
+def logistic_figure(r, K, n_zeros):
+    import matplotlib.pyplot as plt
+    t = np.linspace(0., 40)
+    fig, axs = plt.subplots(1, len(n_zeros), figsize=(9, 3), sharey=True, sharex=True)
+    for ax, n_zero in zip(axs, n_zeros):
+        ax.plot(t, logistic(t, r, K, n_zero))
+        ax.plot(t, [K]*len(t), 'r--', label='K')
+    axs[0].set_xlim([0,20])
+    axs[-1].legend()
+    axs[len(axs)//2].set_xlabel('time, year')
+    axs[0].set_ylabel('Fish Stock')
+    fig.suptitle("Demonstration of the Logistic Model")
+    return fig
@@ -0,0 +1,17 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.plotting import render_batch
+from logistic_plots import phase_portrait_figure, logistic_figure
+
+#Draw the logistic model figures headless, one worker per figure
+if __name__ == '__main__':
+    r = 0.4
+    K = 700
+    os.makedirs('images', exist_ok=True)
+    jobs = [
+        (phase_portrait_figure, (r, K), 'images/phase_portrait.png'),
+        (logistic_figure, (r, K, [100, 800, K]), 'images/logistic_curve.png'),
+    ]
+    for filename in render_batch(jobs):
+        print('Saved', filename)
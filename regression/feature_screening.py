@@ -0,0 +1,23 @@
+from least_squares import stream_stats, numeric_columns
+from subset_selection import all_subsets, forward_selection, bootstrap
+
+if __name__ == '__main__':
+    #Screen every numeric column as a predictor of tree height
+    predictors = [c for c in numeric_columns('vegstr.csv') if c not in ['stemheight', 'indvidual_id']]
+    stats = stream_stats('vegstr.csv', predictors, 'stemheight', n_blocks=200)
+
+    #Greedy forward selection path
+    print('Forward selection:')
+    for model in forward_selection(stats):
+        print(model.predictors, 'R-squared:', model.r_squared, 'n:', model.n)
+
+    #Best small subsets
+    print('Best subsets of up to 3 predictors:')
+    for model in all_subsets(stats, max_size=3)[:10]:
+        print(model.predictors, 'R-squared:', model.r_squared, 'n:', model.n)
+
+    #Bootstrap confidence intervals for the models used in the chapter
+    for subset in [['maxcanopydiam'], ['maxcanopydiam', 'dbh']]:
+        lower, upper = bootstrap(stats, subset, n_resamples=2000)
+        for name, lo, hi in zip(subset, lower, upper):
+            print(name, '95% CI for slope:', lo, '-', hi)
@@ -0,0 +1,135 @@
+import numpy as np
+
+#Sufficient statistics for least squares over a fixed set of columns
+#For each pattern of missing values we keep the Gram matrix of [1, x_1, ..., x_p, y],
+#which holds n, sum(x), X^T X, X^T y, sum(y) and sum(y^2). Any subset of predictors can
+#then be fitted on its complete rows without rereading the data.
+#Rows are also dealt round-robin into n_blocks blocks with their own matrices, so
+#bootstrap resamples can reweight blocks instead of revisiting rows.
+class RegressionStats:
+    def __init__(self, predictors, target, n_blocks=1):
+        self.predictors = list(predictors)
+        self.target = target
+        self.columns = self.predictors + [self.target]
+        self.n_blocks = n_blocks
+        self.rows = 0
+        self.shift = None
+        self.grams = {}
+        self.totals = None
+
+    def update(self, chunk):
+        Z = chunk[self.columns].to_numpy(dtype=float)
+        if len(Z) == 0:
+            return self
+        #Center on the first chunk's means to keep the sums well conditioned
+        if self.shift is None:
+            self.shift = np.nan_to_num(np.nanmean(Z, axis=0))
+        Z = Z - self.shift
+
+        missing = np.isnan(Z)
+        codes = missing @ (1 << np.arange(Z.shape[1]))
+        blocks = (self.rows + np.arange(len(Z))) % self.n_blocks
+        self.rows += len(Z)
+        self.totals = None
+        A = np.column_stack([np.ones(len(Z)), np.nan_to_num(Z)])
+
+        #Group rows by (block, missing pattern) with one sort
+        keys = blocks * (1 << Z.shape[1]) + codes
+        order = np.argsort(keys, kind='stable')
+        uniq, starts = np.unique(keys[order], return_index=True)
+        for key, rows in zip(uniq, np.split(A[order], starts[1:])):
+            self.grams[key] = self.grams.get(key, 0) + rows.T @ rows
+        return self
+
+    def mask(self, columns):
+        mask = 0
+        for column in columns:
+            mask |= 1 << self.columns.index(column)
+        return mask
+
+    #Per-block Gram matrices over every missing-value pattern where the given columns are present
+    def block_grams(self, columns):
+        mask = self.mask(columns)
+        n_codes = 1 << len(self.columns)
+        G = np.zeros((self.n_blocks, len(self.columns)+1, len(self.columns)+1))
+        for key, g in self.grams.items():
+            block, code = divmod(int(key), n_codes)
+            if code & mask == 0:
+                G[block] += g
+        return G
+
+    #Gram matrices summed over blocks, one per missing-value pattern
+    def pattern_grams(self):
+        if self.totals is None:
+            n_codes = 1 << len(self.columns)
+            self.totals = {}
+            for key, g in self.grams.items():
+                code = int(key) % n_codes
+                self.totals[code] = self.totals.get(code, 0) + g
+        return self.totals
+
+    #Gram matrix over every missing-value pattern where the given columns are present
+    def gram(self, columns):
+        mask = self.mask(columns)
+        G = np.zeros((len(self.columns)+1, len(self.columns)+1))
+        for code, g in self.pattern_grams().items():
+            if code & mask == 0:
+                G += g
+        return G
+
+#Accumulate statistics in one pass over a CSV, reading chunksize rows at a time
+def stream_stats(filename, predictors, target, chunksize=100000, n_blocks=1):
+    import pandas as pd
+    stats = RegressionStats(predictors, target, n_blocks)
+    columns = stats.columns
+    for chunk in pd.read_csv(filename, usecols=columns, chunksize=chunksize):
+        stats.update(chunk)
+    return stats
+
+#Numeric columns of a CSV, judged from its first rows
+#Columns with no values in those rows are left out, since they cannot be fitted
+def numeric_columns(filename, nrows=1000):
+    import pandas as pd
+    data = pd.read_csv(filename, nrows=nrows).select_dtypes('number')
+    return data.columns[data.notna().any()].to_list()
+
+class LinearFit:
+    def __init__(self, predictors, intercept, coef, r_squared, n):
+        self.predictors = predictors
+        self.intercept = intercept
+        self.coef = coef
+        self.r_squared = r_squared
+        self.n = n
+
+    def predict(self, X):
+        return self.intercept + np.asarray(X, dtype=float).reshape((-1, len(self.coef))) @ self.coef
+
+#Number of rows where all of the given columns are present
+def complete_rows(stats, columns):
+    return int(stats.gram(columns)[0, 0])
+
+#Solve the normal equations for a subset of predictors from accumulated statistics
+#Needs more complete rows than coefficients, otherwise R^2 is undefined
+def fit(stats, predictors):
+    predictors = list(predictors)
+    G = stats.gram(predictors + [stats.target])
+    idx = [0] + [1 + stats.columns.index(p) for p in predictors]
+    y = 1 + stats.columns.index(stats.target)
+
+    n = G[0, 0]
+    if n <= len(predictors) + 1:
+        raise ValueError('%d complete rows are too few to fit %d predictors' % (n, len(predictors)))
+    XtX = G[np.ix_(idx, idx)]
+    Xty = G[idx, y]
+    beta = np.linalg.lstsq(XtX, Xty, rcond=None)[0]
+
+    #Residual and total sums of squares from the same statistics
+    sse = G[y, y] - beta @ Xty
+    sst = G[y, y] - G[0, y] ** 2 / n
+    r_squared = 1 - sse/sst
+
+    #Undo the centering shift for the intercept
+    shift = stats.shift[[stats.columns.index(p) for p in predictors]]
+    coef = beta[1:]
+    intercept = beta[0] + stats.shift[-1] - coef @ shift
+    return LinearFit(predictors, intercept, coef, r_squared, int(n))
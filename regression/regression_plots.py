@@ -0,0 +1,45 @@
+#Figure code for the regression chapter; matplotlib is only imported when a figure is drawn
+
+#Data points with the univariate regression line
+def univariate_figure(data, pred_height):
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots(figsize = (9, 5))
+    ax.plot(data.maxcanopydiam, data.stemheight, 'k.', alpha=0.5, label='Data points')
+    ax.plot(data.maxcanopydiam, pred_height, '-', label='Regression line')
+    ax.legend()
+    ax.grid()
+    ax.set_xlabel('Canopy diameter, m')
+    ax.set_ylabel('Trunk height, m')
+    return fig
+
+#Data points with the fitted multivariate regression surface
+def surface_figure(data, pred_height):
+    import matplotlib.pyplot as plt
+    from mpl_toolkits import mplot3d
+    fig = plt.figure(figsize = (9,6))
+    ax = fig.add_subplot(projection='3d')
+    ax.scatter3D(data.dbh, data.maxcanopydiam, data.stemheight, color='black')
+    ax.plot_trisurf(data.dbh, data.maxcanopydiam, pred_height, alpha=0.5)
+    ax.set_xlabel('Trunk diameter, cm')
+    ax.set_ylabel('Canopy diameter, m')
+    ax.set_zlabel('Trunk height, m')
+    return fig
+
+#Multivariate predictions against each predictor
+def prediction_panels(data, pred_height):
+    import matplotlib.pyplot as plt
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(9, 4.5), tight_layout=True)
+    ax1.plot(data.maxcanopydiam, data.stemheight, 'k.', alpha=0.5, label='Data points')
+    ax1.plot(data.maxcanopydiam, pred_height, '.', label='Predicted Values')
+    ax1.legend()
+    ax1.grid()
+    ax1.set_xlabel('Canopy diameter, m')
+    ax1.set_ylabel('Trunk height, m')
+
+    ax2.plot(data.dbh, data.stemheight, 'k.', alpha=0.5, label='Data points')
+    ax2.plot(data.dbh, pred_height, '.', label='Predicted Values')
+    ax2.legend()
+    ax2.grid()
+    ax2.set_xlabel('Trunk diameter, cm')
+    ax2.set_ylabel('Trunk height, m')
+    return fig
@@ -0,0 +1,24 @@
+import os
+import sys
+import pandas as pd
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common.plotting import render_batch
+from least_squares import RegressionStats, fit
+from regression_plots import univariate_figure, surface_figure, prediction_panels
+
+#Fit both models and draw every regression figure headless in parallel
+if __name__ == '__main__':
+    data = pd.read_csv('vegstr.csv')
+    stats = RegressionStats(['maxcanopydiam', 'dbh'], 'stemheight').update(data)
+
+    pred_height = fit(stats, ['maxcanopydiam']).predict(data.maxcanopydiam)
+    multi_data = data.dropna(subset=['dbh']).reset_index(drop=True)
+    multi_pred = fit(stats, ['maxcanopydiam', 'dbh']).predict(multi_data[['maxcanopydiam', 'dbh']])
+
+    jobs = [
+        (univariate_figure, (data, pred_height), 'images/univariate_regression.png'),
+        (surface_figure, (multi_data, multi_pred), 'images/multiple_regression_3d.png'),
+        (prediction_panels, (multi_data, multi_pred), 'images/multivariate_regression.png'),
+    ]
+    for filename in render_batch(jobs):
+        print('Saved', filename)
@@ -0,0 +1,76 @@
+import os
+from itertools import combinations, repeat
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from least_squares import fit, complete_rows
+
+#Fit every subset of predictors (up to max_size) from the accumulated statistics
+#Each fit only touches a (p+2)x(p+2) matrix, so the cost does not depend on the number of rows
+def all_subsets(stats, max_size=None):
+    if max_size is None:
+        max_size = len(stats.predictors)
+    fits = []
+    for size in range(1, max_size+1):
+        for subset in combinations(stats.predictors, size):
+            #Skip subsets without enough complete rows to fit
+            if complete_rows(stats, list(subset) + [stats.target]) > size + 1:
+                fits.append(fit(stats, subset))
+    return sorted(fits, key=lambda model: model.r_squared, reverse=True)
+
+#Greedy forward selection: add the predictor that gives the largest R^2 at each step
+def forward_selection(stats, max_size=None):
+    if max_size is None:
+        max_size = len(stats.predictors)
+    chosen = []
+    remaining = list(stats.predictors)
+    path = []
+    while remaining and len(chosen) < max_size:
+        candidates = [fit(stats, chosen + [p]) for p in remaining
+                      if complete_rows(stats, chosen + [p, stats.target]) > len(chosen) + 2]
+        if len(candidates) == 0:
+            break
+        best = max(candidates, key=lambda model: model.r_squared)
+        path.append(best)
+        chosen = list(best.predictors)
+        remaining.remove(chosen[-1])
+    return path
+
+#Slopes for a batch of block-bootstrap resamples, and how many resamples were dropped
+#Each resample draws blocks with replacement and sums their weighted Gram matrices; resamples
+#whose predictors are collinear (e.g. a column that is constant in the drawn blocks) are singular
+#and are dropped rather than solved
+def bootstrap_batch(grams, n_resamples, seed):
+    rng = np.random.default_rng(seed)
+    n_blocks = len(grams)
+    weights = rng.multinomial(n_blocks, np.full(n_blocks, 1/n_blocks), size=n_resamples)
+    G = np.tensordot(weights, grams, axes=1)
+    XtX = G[:, :-1, :-1]
+    Xty = G[:, :-1, -1]
+    full_rank = np.linalg.matrix_rank(XtX) == XtX.shape[1]
+    beta = np.linalg.solve(XtX[full_rank], Xty[full_rank][:, :, None])[:, :, 0]
+    return beta[:, 1:], int(n_resamples - full_rank.sum())
+
+#Bootstrap confidence intervals on the slopes of one predictor subset
+#stats must be accumulated with n_blocks > 1; resamples are split across process workers
+def bootstrap(stats, predictors, n_resamples=1000, alpha=0.05, workers=None, seed=0):
+    predictors = list(predictors)
+    keep = [0] + [1 + stats.columns.index(c) for c in predictors + [stats.target]]
+    grams = stats.block_grams(predictors + [stats.target])[:, keep][:, :, keep]
+    #Drop blocks with no complete rows so they are not drawn as empty resamples
+    grams = grams[grams[:, 0, 0] > 0]
+
+    if workers is None:
+        workers = os.cpu_count()
+    sizes = [len(part) for part in np.array_split(np.arange(n_resamples), workers) if len(part) > 0]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    with ProcessPoolExecutor(workers) as pool:
+        batches = list(pool.map(bootstrap_batch, repeat(grams), sizes, seeds))
+    slopes = np.vstack([batch for batch, dropped in batches])
+    dropped = sum(dropped for batch, dropped in batches)
+    if dropped > 0:
+        print('Dropped', dropped, 'of', n_resamples, 'bootstrap resamples with singular normal equations')
+    if len(slopes) == 0:
+        raise ValueError('every bootstrap resample of %s is singular' % predictors)
+
+    lower, upper = np.percentile(slopes, [100*alpha/2, 100*(1 - alpha/2)], axis=0)
+    return lower, upper
@@ -0,0 +1,42 @@
+import os
+import sys
+import math
+import numpy as np
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from common import instrument
+
+#Rates for the mRNA master equation: Sm is synthesis, dm is degradation
+def get_m(n, mo, Sm, dm):
+    mn = mo*Sm/dm*(1/math.factorial(n))
+    return mn
+
+def get_g(n, dm):
+    return n*dm
+
+def get_P(Ps, t, n, mo, Sm, dm):
+    f = Sm
+    if n == 0:
+        dPdt = get_g(n+1, dm)*get_m(n+1, mo, Sm, dm) - get_m(n, mo, Sm, dm)*(get_g(n, dm)+f)
+    else:
+        dPdt = f*get_m(n-1, mo, Sm, dm) + get_g(n+1, dm)*get_m(n+1, mo, Sm, dm) - get_m(n, mo, Sm, dm)*(get_g(n, dm)+f)
+    return [dPdt]
+
+#Integrate one trajectory for every initial count mo and molecule number n below max_n
+def sweep(max_n=10, times=None, Smdm=0.01):
+    from scipy.integrate import odeint
+    if times is None:
+        times = np.linspace(0., 1., 101)
+    Sm = Smdm*1
+    dm = 1/Smdm
+    Ps = []
+    for mo in np.arange(0., max_n, 1.): #iterate on mo
+        with instrument.timer('master_sweep_row', mo=mo):
+            for i in range(max_n):
+                #odeint reports its own RHS evaluation count, so the RHS itself stays untouched
+                if instrument.enabled:
+                    ans, info = odeint(func=get_P, y0=[mo], t=times, args=(i, mo, Sm, dm), full_output=True)
+                    instrument.count('master_rhs_calls', int(info['nfe'][-1]))
+                else:
+                    ans = odeint(func=get_P, y0=[mo], t=times, args=(i, mo, Sm, dm))
+                Ps.append(ans[:, 0])
+    return Ps